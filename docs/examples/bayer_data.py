@@ -1,11 +1,3 @@
-from __future__ import (
-    unicode_literals,
-    absolute_import,
-    print_function,
-    division,
-    )
-
-
 import io
 import time
 import picamera
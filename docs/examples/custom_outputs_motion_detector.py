@@ -1,5 +1,3 @@
-from __future__ import division
-
 import picamera
 import numpy as np
 
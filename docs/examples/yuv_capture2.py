@@ -1,5 +1,3 @@
-from __future__ import division
-
 import time
 import picamera
 import numpy as np
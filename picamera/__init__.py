@@ -32,84 +32,133 @@ The picamera package consists of several modules which provide a pure Python
 interface to the Raspberry Pi's camera module. The package is only intended to
 run on a Raspberry Pi, and expects to be able to load the MMAL library
 (libmmal.so) upon import.
+"""
 
-The classes defined by most modules in this package are available directly from
-the :mod:`picamera` namespace. In other words, the following code is typically
-all that is required to access classes in the package::
-
-    import picamera
-
-The :mod:`picamera.array` module is an exception to this as it depends on the
-third-party `numpy`_ package (this avoids making numpy a mandatory dependency
-for picamera).
-
-.. _numpy: http://www.numpy.org/
+__all__ = (
+    'PiCameraWarning',
+    'PiCameraDeprecated',
+    'PiCameraFallback',
+    'PiCameraResizerEncoding',
+    'PiCameraAlphaStripping',
+    'PiCameraResolutionRounded',
+    'PiCameraError',
+    'PiCameraRuntimeError',
+    'PiCameraClosed',
+    'PiCameraNotRecording',
+    'PiCameraAlreadyRecording',
+    'PiCameraValueError',
+    'PiCameraIOError',
+    'PiCameraMMALError',
+    'PiCameraPortDisabled',
+    'mmal_check',
+    'PiResolution',
+    'PiFramerateRange',
+    'PiSensorMode',
+    'PiCamera',
+    'PiDisplay',
+    'PiVideoFrame',
+    'PiVideoFrameType',
+    'PiEncoder',
+    'PiVideoEncoder',
+    'PiImageEncoder',
+    'PiRawMixin',
+    'PiCookedVideoEncoder',
+    'PiRawVideoEncoder',
+    'PiOneImageEncoder',
+    'PiMultiImageEncoder',
+    'PiRawImageMixin',
+    'PiCookedOneImageEncoder',
+    'PiRawOneImageEncoder',
+    'PiCookedMultiImageEncoder',
+    'PiRawMultiImageEncoder',
+    'PiRenderer',
+    'PiOverlayRenderer',
+    'PiPreviewRenderer',
+    'PiNullSink',
+    'PiCameraCircularIO',
+    'CircularIO',
+    'BufferIO',
+    'Color',
+    'Red',
+    'Green',
+    'Blue',
+    'Hue',
+    'Lightness',
+    'Saturation',
+    )
 
+from picamera.exc import *
 
-The following sections document the various modules available within the
-package:
+# The remaining classes are imported lazily upon first access (see PEP 562) to
+# avoid the cost of loading every sub-module when a script only requires one
+# or two classes from the package
+_LAZY = {
+    'PiResolution':              'picamera.mmalobj',
+    'PiFramerateRange':          'picamera.mmalobj',
+    'PiSensorMode':              'picamera.mmalobj',
+    'PiCamera':                  'picamera.camera',
+    'PiDisplay':                 'picamera.display',
+    'PiVideoFrame':              'picamera.frames',
+    'PiVideoFrameType':          'picamera.frames',
+    'PiEncoder':                 'picamera.encoders',
+    'PiVideoEncoder':            'picamera.encoders',
+    'PiImageEncoder':            'picamera.encoders',
+    'PiRawMixin':                'picamera.encoders',
+    'PiCookedVideoEncoder':      'picamera.encoders',
+    'PiRawVideoEncoder':         'picamera.encoders',
+    'PiOneImageEncoder':         'picamera.encoders',
+    'PiMultiImageEncoder':       'picamera.encoders',
+    'PiRawImageMixin':           'picamera.encoders',
+    'PiCookedOneImageEncoder':   'picamera.encoders',
+    'PiRawOneImageEncoder':      'picamera.encoders',
+    'PiCookedMultiImageEncoder': 'picamera.encoders',
+    'PiRawMultiImageEncoder':    'picamera.encoders',
+    'PiRenderer':                'picamera.renderers',
+    'PiOverlayRenderer':         'picamera.renderers',
+    'PiPreviewRenderer':         'picamera.renderers',
+    'PiNullSink':                'picamera.renderers',
+    'PiCameraCircularIO':        'picamera.streams',
+    'CircularIO':                'picamera.streams',
+    'BufferIO':                  'picamera.streams',
+    'Color':                     'picamera.color',
+    'Red':                       'picamera.color',
+    'Green':                     'picamera.color',
+    'Blue':                      'picamera.color',
+    'Hue':                       'picamera.color',
+    'Lightness':                 'picamera.color',
+    'Saturation':                'picamera.color',
+    }
 
-* :mod:`picamera.camera`
-* :mod:`picamera.encoders`
-* :mod:`picamera.frames`
-* :mod:`picamera.streams`
-* :mod:`picamera.renderers`
-* :mod:`picamera.color`
-* :mod:`picamera.exc`
-* :mod:`picamera.array`
-"""
+# Sub-modules which used to be bound as attributes of the package by the eager
+# imports above, and which are now imported upon first access instead
+_SUBMODULES = {
+    'mmalobj',
+    'camera',
+    'display',
+    'frames',
+    'encoders',
+    'renderers',
+    'streams',
+    'color',
+    }
 
-from __future__ import (
-    unicode_literals,
-    print_function,
-    division,
-    absolute_import,
-    )
 
-# Make Py2's str equivalent to Py3's
-str = type('')
+def __getattr__(name):
+    import importlib
+    if name in _SUBMODULES:
+        # Importing the sub-module binds it as an attribute of the package so
+        # this function won't be called for it again
+        return importlib.import_module('.' + name, __name__)
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            'module %r has no attribute %r' % (__name__, name)) from None
+    value = getattr(importlib.import_module(module), name)
+    # Cache the result so subsequent look-ups bypass this function entirely
+    globals()[name] = value
+    return value
 
-from picamera.exc import (
-    PiCameraWarning,
-    PiCameraDeprecated,
-    PiCameraFallback,
-    PiCameraAlphaStripping,
-    PiCameraResizerEncoding,
-    PiCameraError,
-    PiCameraRuntimeError,
-    PiCameraClosed,
-    PiCameraNotRecording,
-    PiCameraAlreadyRecording,
-    PiCameraValueError,
-    PiCameraMMALError,
-    PiCameraPortDisabled,
-    mmal_check,
-    )
-from picamera.mmalobj import PiResolution, PiFramerateRange, PiSensorMode
-from picamera.camera import PiCamera
-from picamera.display import PiDisplay
-from picamera.frames import PiVideoFrame, PiVideoFrameType
-from picamera.encoders import (
-    PiEncoder,
-    PiVideoEncoder,
-    PiImageEncoder,
-    PiRawMixin,
-    PiCookedVideoEncoder,
-    PiRawVideoEncoder,
-    PiOneImageEncoder,
-    PiMultiImageEncoder,
-    PiRawImageMixin,
-    PiCookedOneImageEncoder,
-    PiRawOneImageEncoder,
-    PiCookedMultiImageEncoder,
-    PiRawMultiImageEncoder,
-    )
-from picamera.renderers import (
-    PiRenderer,
-    PiOverlayRenderer,
-    PiPreviewRenderer,
-    PiNullSink,
-    )
-from picamera.streams import PiCameraCircularIO, CircularIO, BufferIO
-from picamera.color import Color, Red, Green, Blue, Hue, Lightness, Saturation
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
@@ -27,21 +27,6 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from __future__ import (
-    unicode_literals,
-    print_function,
-    division,
-    absolute_import,
-    )
-
-# Make Py2's str and range equivalent to Py3's
-native_str = str
-str = type('')
-try:
-    range = xrange
-except NameError:
-    pass
-
 import io
 import ctypes as ct
 import warnings
@@ -59,9 +44,9 @@ from .exc import (
 
 
 motion_dtype = np.dtype([
-    (native_str('x'),   np.int8),
-    (native_str('y'),   np.int8),
-    (native_str('sad'), np.uint16),
+    ('x',   np.int8),
+    ('y',   np.int8),
+    ('sad', np.uint16),
     ])
 
 
@@ -27,22 +27,6 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from __future__ import (
-    unicode_literals,
-    print_function,
-    division,
-    absolute_import,
-    )
-# Make Py2's zip equivalent to Py3's
-try:
-    from itertools import izip as zip
-except ImportError:
-    pass
-
-# Make Py2's str and range equivalent to Py3's
-str = type('')
-
-
 import colorsys
 from math import pi, sqrt, atan2, degrees, radians, sin, cos, exp
 from fractions import Fraction
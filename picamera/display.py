@@ -27,16 +27,6 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from __future__ import (
-    unicode_literals,
-    print_function,
-    division,
-    absolute_import,
-    )
-
-# Make Py2's str equivalent to Py3's
-str = type('')
-
 import mimetypes
 import ctypes as ct
 from functools import reduce
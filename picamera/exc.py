@@ -27,19 +27,27 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from __future__ import (
-    unicode_literals,
-    print_function,
-    division,
-    absolute_import,
-    )
-
-# Make Py2's str equivalent to Py3's
-str = type('')
-
-
 import picamera.mmal as mmal
 
+__all__ = (
+    'PiCameraWarning',
+    'PiCameraDeprecated',
+    'PiCameraFallback',
+    'PiCameraResizerEncoding',
+    'PiCameraAlphaStripping',
+    'PiCameraResolutionRounded',
+    'PiCameraError',
+    'PiCameraRuntimeError',
+    'PiCameraClosed',
+    'PiCameraNotRecording',
+    'PiCameraAlreadyRecording',
+    'PiCameraValueError',
+    'PiCameraIOError',
+    'PiCameraMMALError',
+    'PiCameraPortDisabled',
+    'mmal_check',
+    )
+
 
 class PiCameraWarning(Warning):
     """
@@ -34,14 +34,8 @@ import os
 import sys
 from setuptools import setup, find_packages
 
-if sys.version_info[0] == 2:
-    if not sys.version_info >= (2, 7):
-        raise ValueError('This package requires Python 2.7 or above')
-elif sys.version_info[0] == 3:
-    if not sys.version_info >= (3, 2):
-        raise ValueError('This package requires Python 3.2 or above')
-else:
-    raise ValueError('Unrecognized major version of Python')
+if not sys.version_info >= (3, 7):
+    raise ValueError('This package requires Python 3.7 or above')
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 
@@ -58,18 +52,16 @@ __author_email__ = 'dave@waveform.org.uk'
 __url__          = 'http://picamera.readthedocs.io/'
 __platforms__    = 'ALL'
 
+__python_requires__ = '>=3.7'
+
 __classifiers__ = [
     "Development Status :: 5 - Production/Stable",
     "Intended Audience :: Developers",
     "License :: OSI Approved :: BSD License",
     "Operating System :: POSIX :: Linux",
-    "Programming Language :: Python :: 2.7",
     "Programming Language :: Python :: 3",
-    "Programming Language :: Python :: 3.2",
-    "Programming Language :: Python :: 3.3",
-    "Programming Language :: Python :: 3.4",
-    "Programming Language :: Python :: 3.5",
-    "Programming Language :: Python :: 3.6",
+    "Programming Language :: Python :: 3 :: Only",
+    "Programming Language :: Python :: 3.7",
     'Topic :: Multimedia :: Graphics :: Capture :: Digital Camera',
 ]
 
@@ -112,6 +104,7 @@ def main():
             packages             = find_packages(),
             include_package_data = True,
             platforms            = __platforms__,
+            python_requires      = __python_requires__,
             install_requires     = __requires__,
             extras_require       = __extra_requires__,
             entry_points         = __entry_points__,
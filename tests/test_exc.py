@@ -27,18 +27,10 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from __future__ import (
-    unicode_literals,
-    print_function,
-    division,
-    absolute_import,
-    )
-
-# Make Py2's str equivalent to Py3's
-str = type('')
-
 import warnings
 
+import picamera
+import picamera.exc
 from picamera import mmal, PiCamera
 from picamera.exc import mmal_check, PiCameraError, PiCameraDeprecated
 import pytest
@@ -62,3 +54,9 @@ def test_posargs_deprecated():
         for warning in w:
             assert issubclass(warning.category, PiCameraDeprecated)
             assert 'non-keyword argument is deprecated' in str(warning.message)
+
+
+def test_exc_exports():
+    for name in picamera.exc.__all__:
+        assert name in picamera.__all__
+        assert getattr(picamera, name) is getattr(picamera.exc, name)
@@ -27,20 +27,53 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from __future__ import (
-    unicode_literals,
-    print_function,
-    division,
-    absolute_import,
-    )
-
-# Make Py2's str equivalent to Py3's
-str = type('')
+import sys
+import subprocess
 
 import picamera
+import picamera.exc
 import pytest
 
 def test_dual_camera(camera):
     with pytest.raises(picamera.PiCameraError):
         another_camera = picamera.PiCamera()
 
+
+def test_lazy_import():
+    # Must run in a fresh interpreter as the test suite itself will already
+    # have imported most of the package
+    script = """\
+import sys
+import picamera
+for name in ('picamera.camera', 'picamera.encoders', 'picamera.streams'):
+    assert name not in sys.modules, name
+"""
+    subprocess.check_call([sys.executable, '-c', script])
+
+
+def test_lazy_submodules():
+    for name in picamera._SUBMODULES:
+        assert getattr(picamera, name) is sys.modules['picamera.' + name]
+        assert name in dir(picamera)
+
+
+def test_lazy_attributes():
+    from picamera.encoders import PiCookedVideoEncoder
+    from picamera.streams import PiCameraCircularIO
+    assert picamera.PiCookedVideoEncoder is PiCookedVideoEncoder
+    assert picamera.PiCameraCircularIO is PiCameraCircularIO
+    assert 'PiCameraCircularIO' in vars(picamera)
+    assert 'PiRawMultiImageEncoder' in dir(picamera)
+    assert 'importlib' not in dir(picamera)
+    with pytest.raises(AttributeError) as exc_info:
+        picamera.PiNonExistent
+    assert exc_info.value.__suppress_context__
+
+
+def test_all_exports():
+    assert isinstance(picamera.__all__, tuple)
+    assert set(picamera.exc.__all__) <= set(picamera.__all__)
+    assert set(picamera._LAZY) <= set(picamera.__all__)
+    assert len(set(picamera.__all__)) == len(picamera.__all__)
+    for name in picamera.__all__:
+        assert getattr(picamera, name) is not None